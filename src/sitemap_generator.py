@@ -6,7 +6,9 @@ Generates individual sitemaps from CSV files and creates a main sitemap index.
 """
 
 import argparse
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
@@ -19,7 +21,8 @@ from validators import ValidationError
 class SitemapGenerator:
     """Main sitemap generation orchestrator."""
 
-    def __init__(self, input_dir: Path, output_dir: Path, base_url: str):
+    def __init__(self, input_dir: Path, output_dir: Path, base_url: str,
+                 workers: Optional[int] = None):
         """
         Initialize sitemap generator.
 
@@ -27,10 +30,13 @@ class SitemapGenerator:
             input_dir: Directory containing CSV input files
             output_dir: Directory where XML files will be saved
             base_url: Base URL for sitemap locations
+            workers: Number of worker processes for sitemap generation
+                (default: one per CPU, capped at the number of CSV files)
         """
         self.input_dir = Path(input_dir)
         self.output_dir = Path(output_dir)
         self.base_url = base_url.rstrip('/') + '/'
+        self.workers = workers
 
         # Create output directory if it doesn't exist
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -53,20 +59,55 @@ class SitemapGenerator:
         print(f"Found {len(csv_files)} CSV file(s)")
         print()
 
+        workers = self._get_max_workers(len(csv_files))
+
         # Generate individual sitemaps
         generated_files = []
-        for csv_file in csv_files:
-            try:
-                sitemap_file = self.generate_sitemap(csv_file)
-                if sitemap_file:
-                    generated_files.append(sitemap_file)
-            except Exception as e:
-                print(f"Error processing {csv_file.name}: {e}")
-                continue
+        if workers > 1:
+            # Each CSV is self-contained (parse, build, write), so files
+            # can be split across worker processes. The sitemap index is
+            # still built sequentially by the caller once all results
+            # are in.
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_generate_one, csv_file, self.output_dir, self.base_url)
+                    for csv_file in csv_files
+                ]
+                for csv_file, future in zip(csv_files, futures):
+                    try:
+                        sitemap_file = future.result()
+                        if sitemap_file:
+                            generated_files.append(sitemap_file)
+                    except Exception as e:
+                        print(f"Error processing {csv_file.name}: {e}")
+                        continue
+        else:
+            for csv_file in csv_files:
+                try:
+                    sitemap_file = self.generate_sitemap(csv_file)
+                    if sitemap_file:
+                        generated_files.append(sitemap_file)
+                except Exception as e:
+                    print(f"Error processing {csv_file.name}: {e}")
+                    continue
 
         print()
         return generated_files
 
+    def _get_max_workers(self, file_count: int) -> int:
+        """
+        Determine the number of worker processes to use.
+
+        Args:
+            file_count: Number of CSV files to process
+
+        Returns:
+            Worker count (explicit setting, or one per CPU capped at file_count)
+        """
+        if self.workers:
+            return max(1, self.workers)
+        return max(1, min(os.cpu_count() or 1, file_count))
+
     def generate_sitemap(self, csv_path: Path) -> Optional[Path]:
         """
         Generate a single sitemap from a CSV file.
@@ -167,6 +208,25 @@ class SitemapGenerator:
         return 0
 
 
+def _generate_one(csv_path: Path, output_dir: Path, base_url: str) -> Optional[Path]:
+    """
+    Generate a sitemap for a single CSV file in a worker process.
+
+    Module-level function so ProcessPoolExecutor can pickle it without
+    sending a SitemapGenerator instance across processes.
+
+    Args:
+        csv_path: Path to CSV file
+        output_dir: Directory where the XML file will be saved
+        base_url: Base URL for sitemap locations
+
+    Returns:
+        Path to generated XML file, or None if generation failed
+    """
+    generator = SitemapGenerator(csv_path.parent, output_dir, base_url, workers=1)
+    return generator.generate_sitemap(csv_path)
+
+
 def main():
     """Main entry point for CLI."""
     parser = argparse.ArgumentParser(
@@ -200,13 +260,21 @@ def main():
         help='Process only a single CSV file instead of all files in input directory'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of worker processes (default: one per CPU, capped at file count)'
+    )
+
     args = parser.parse_args()
 
     # Create generator
     generator = SitemapGenerator(
         input_dir=args.input,
         output_dir=args.output,
-        base_url=args.base_url
+        base_url=args.base_url,
+        workers=args.workers
     )
 
     # Run generation
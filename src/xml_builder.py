@@ -5,7 +5,11 @@ XML building utilities for sitemap generation.
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict
-import xml.etree.ElementTree as ET
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
 
 from config import (
     SITEMAP_NAMESPACE,
@@ -13,7 +17,62 @@ from config import (
     BASE_URL,
     DATE_FORMAT,
 )
-from validators import validate_sitemap_size, escape_xml
+from validators import validate_sitemap_size, escape_xml, ValidationError
+
+
+class _CountingWriter:
+    """
+    Encode-once writer that counts bytes as they pass through.
+
+    The same UTF-8 bytes feed both the output file and the size-limit
+    check, instead of encoding the whole document a second time just to
+    measure it.
+    """
+
+    def __init__(self, f):
+        """
+        Args:
+            f: Binary file object to write to
+        """
+        self.f = f
+        self.size_bytes = 0
+
+    def write(self, text: str) -> None:
+        data = text.encode('utf-8')
+        self.size_bytes += len(data)
+        self.f.write(data)
+
+
+def _emit_url(entry: Dict[str, str]) -> str:
+    """
+    Format one <url> block as a single string.
+
+    Building the whole block at once costs one string join and one write
+    per entry instead of one per line.
+
+    Args:
+        entry: URL entry dictionary
+
+    Returns:
+        Formatted <url> element, newline-terminated
+    """
+    parts = [f'    <url>\n        <loc>{escape_xml(entry["url"])}</loc>\n']
+
+    lastmod = entry.get('lastmod')
+    if lastmod:
+        parts.append(f'        <lastmod>{lastmod}</lastmod>\n')
+
+    metadata = entry.get('metadata')
+    if metadata:
+        parts.append('        <coveo:metadata>\n')
+        parts.append(''.join(
+            f'            <{field_name}>{escape_xml(field_value)}</{field_name}>\n'
+            for field_name, field_value in metadata.items()
+        ))
+        parts.append('        </coveo:metadata>\n')
+
+    parts.append('    </url>\n')
+    return ''.join(parts)
 
 
 class XMLBuilder:
@@ -28,46 +87,90 @@ class XMLBuilder:
             url_entries: List of URL entry dictionaries
             output_path: Path where XML file will be saved
         """
-        # Register namespace prefix
-        ET.register_namespace('coveo', COVEO_NAMESPACE)
+        if etree is not None:
+            XMLBuilder._build_sitemap_lxml(url_entries, output_path)
+            return
 
-        # Build XML manually for better control over formatting
-        lines = ['<?xml version="1.0" encoding="UTF-8"?>']
-        lines.append(f'<urlset xmlns="{SITEMAP_NAMESPACE}" xmlns:coveo="{COVEO_NAMESPACE}">')
+        # Check the URL count up front, before writing anything
+        validate_sitemap_size(len(url_entries), 0)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Stream XML straight to a buffered file instead of accumulating
+        # a per-line list and joining it: peak memory stays flat no
+        # matter how large the sitemap is. The counting writer encodes
+        # each chunk exactly once, feeding the file and the size check
+        # from the same bytes.
+        with open(output_path, 'wb', buffering=256 * 1024) as f:
+            writer = _CountingWriter(f)
+            write = writer.write
+
+            write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            write(f'<urlset xmlns="{SITEMAP_NAMESPACE}" xmlns:coveo="{COVEO_NAMESPACE}">\n')
+
+            for entry in url_entries:
+                write(_emit_url(entry))
+
+            write('</urlset>')
+
+        # Validate size; don't leave an oversized sitemap behind
+        try:
+            validate_sitemap_size(len(url_entries), writer.size_bytes)
+        except ValidationError:
+            output_path.unlink()
+            raise
+
+        print(f"Generated sitemap: {output_path.name} "
+              f"({len(url_entries)} URLs, {writer.size_bytes:,} bytes)")
+
+    @staticmethod
+    def _build_sitemap_lxml(url_entries: List[Dict[str, str]], output_path: Path) -> None:
+        """
+        Build an individual sitemap with lxml's C-backed serializer.
+
+        The tree is assembled and serialized in libxml2, which also
+        handles escaping, so entry values go in unescaped.
+
+        Args:
+            url_entries: List of URL entry dictionaries
+            output_path: Path where XML file will be saved
+        """
+        # Check the URL count up front, before building anything
+        validate_sitemap_size(len(url_entries), 0)
+
+        nsmap = {None: SITEMAP_NAMESPACE, 'coveo': COVEO_NAMESPACE}
+        root = etree.Element('urlset', nsmap=nsmap)
 
         for entry in url_entries:
-            lines.append('    <url>')
-            # Escape URL for XML
-            escaped_url = escape_xml(entry["url"])
-            lines.append(f'        <loc>{escaped_url}</loc>')
+            url_el = etree.SubElement(root, 'url')
+            etree.SubElement(url_el, 'loc').text = entry['url']
 
             # Add lastmod if present
-            if 'lastmod' in entry and entry['lastmod']:
-                lines.append(f'        <lastmod>{entry["lastmod"]}</lastmod>')
+            lastmod = entry.get('lastmod')
+            if lastmod:
+                etree.SubElement(url_el, 'lastmod').text = lastmod
 
             # Add Coveo metadata if present
-            if 'metadata' in entry and entry['metadata']:
-                lines.append('        <coveo:metadata>')
-                for field_name, field_value in entry['metadata'].items():
-                    lines.append(f'            <{field_name}>{field_value}</{field_name}>')
-                lines.append('        </coveo:metadata>')
-
-            lines.append('    </url>')
+            metadata = entry.get('metadata')
+            if metadata:
+                metadata_el = etree.SubElement(url_el, f'{{{COVEO_NAMESPACE}}}metadata')
+                for field_name, field_value in metadata.items():
+                    etree.SubElement(metadata_el, field_name).text = field_value
 
-        lines.append('</urlset>')
-
-        xml_string = '\n'.join(lines)
+        xml_bytes = etree.tostring(
+            root, xml_declaration=True, encoding='UTF-8', pretty_print=True
+        )
 
         # Validate size
-        size_bytes = len(xml_string.encode('utf-8'))
-        validate_sitemap_size(len(url_entries), size_bytes)
+        validate_sitemap_size(len(url_entries), len(xml_bytes))
 
         # Write to file
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(xml_string)
+        with open(output_path, 'wb') as f:
+            f.write(xml_bytes)
 
-        print(f"Generated sitemap: {output_path.name} ({len(url_entries)} URLs, {size_bytes:,} bytes)")
+        print(f"Generated sitemap: {output_path.name} "
+              f"({len(url_entries)} URLs, {len(xml_bytes):,} bytes)")
 
     @staticmethod
     def build_sitemap_index(sitemap_files: List[Path], output_path: Path, base_url: str = None) -> None:
@@ -90,6 +193,24 @@ class XMLBuilder:
         # Get current date for lastmod
         current_date = datetime.now().strftime(DATE_FORMAT)
 
+        if etree is not None:
+            root = etree.Element('sitemapindex', nsmap={None: SITEMAP_NAMESPACE})
+            for sitemap_file in sorted(sitemap_files):
+                sitemap_el = etree.SubElement(root, 'sitemap')
+                etree.SubElement(sitemap_el, 'loc').text = f'{base_url}{sitemap_file.name}'
+                etree.SubElement(sitemap_el, 'lastmod').text = current_date
+
+            xml_bytes = etree.tostring(
+                root, xml_declaration=True, encoding='UTF-8', pretty_print=True
+            )
+
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, 'wb') as f:
+                f.write(xml_bytes)
+
+            print(f"Generated sitemap index: {output_path.name} ({len(sitemap_files)} sitemaps)")
+            return
+
         # Build XML manually for better control over formatting
         lines = ['<?xml version="1.0" encoding="UTF-8"?>']
         lines.append(f'<sitemapindex xmlns="{SITEMAP_NAMESPACE}">')